@@ -3,13 +3,15 @@
 # Validate thai-province-data v2 using JSON specs in data/spec and inputs from data/raw
 
 import argparse
-import json
 import os
 import re
 import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from json_io import load_json
+from quality import DEFAULT_MAX_KM, analyze
+
 # ---------------------------
 # Paths (relative to repo root)
 # ---------------------------
@@ -60,10 +62,6 @@ class Issues:
             return 1
         return 0
 
-def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def is_integer(v: Any) -> bool:
     if isinstance(v, bool):
         return False
@@ -255,6 +253,10 @@ def main():
     parser.add_argument("--root", default=None, help="Repo root (default: auto detect)")
     parser.add_argument("--fail-on-warn", action="store_true", help="Exit non-zero on warnings")
     parser.add_argument("--strict", action="store_true", help="Stricter schema checks (if applicable)")
+    parser.add_argument("--analyze", action="store_true",
+                        help="Also run cross-table quality checks (outliers, zip/province, duplicates, romanization) as warnings")
+    parser.add_argument("--max-km", type=float, default=DEFAULT_MAX_KM,
+                        help="--analyze: flag sub-districts this far from their district's median point")
     args = parser.parse_args()
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -355,6 +357,13 @@ def main():
     soft_name_trim_check("sub_districts", subs, ["name_th", "name_en"])
     soft_name_trim_check("geographies", geogs, ["name"])
 
+    # Cross-table analysis (opt-in: existing data has known, accepted findings)
+    if args.analyze:
+        for check, found in analyze(raws, args.max_km).items():
+            print(f"• Analyzing {check}: {len(found)} finding(s)")
+            for msg in found:
+                issues.warn(msg)
+
     # Summary
     print("\n✅ Validation finished.")
     exit_code = issues.summarize(args.fail_on_warn)
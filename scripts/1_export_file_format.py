@@ -4,22 +4,29 @@
 
 import argparse
 import csv
-import json
+import importlib.util
 import os
 import sys
 import re
+import zipfile
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from xml.etree.ElementTree import Element, SubElement, ElementTree
 
+from json_io import load_json, load_rows, save_json
+
 # ---------------------------
 # Optional deps for XLSX
 # ---------------------------
-HAS_PANDAS = True
-try:
-    import pandas as pd
-except Exception:
-    HAS_PANDAS = False
+# Only check that pandas is installed; the import itself (slow) happens in write_xlsx
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+# ---------------------------
+# Reproducible XLSX (see normalize_xlsx)
+# ---------------------------
+ZIP_FIXED_DATE = (1980, 1, 1, 0, 0, 0)
+XLSX_FIXED_TIME = b"2000-01-01T00:00:00Z"
+XLSX_CORE_TIME_RE = re.compile(rb"(<dcterms:(created|modified)\b[^>]*>)[^<]*(</dcterms:\2>)")
 
 # ---------------------------
 # Paths
@@ -112,17 +119,6 @@ def ensure_dirs(root: str):
         outdir = os.path.join(root, d)
         os.makedirs(outdir, exist_ok=True)
 
-def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def save_json(path: str, data: Any, indent: int):
-    with open(path, "w", encoding="utf-8") as f:
-        if indent and indent > 0:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
-        else:
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
-
 def sql_escape(value: Any) -> str:
     """Return SQL literal for MySQL dialect."""
     if value is None:
@@ -135,6 +131,14 @@ def sql_escape(value: Any) -> str:
     s = s.replace("'", "''")  # escape single quotes
     return f"'{s}'"
 
+def order_row(r: Dict[str, Any], order: List[str]) -> Dict[str, Any]:
+    """Dict with canonical column order first, unknown keys after (in their original order)."""
+    out = {k: r[k] for k in order if k in r}
+    for k, v in r.items():
+        if k not in out:
+            out[k] = v
+    return out
+
 def to_rows_in_order(rows: List[Dict[str, Any]], order: List[str]) -> List[List[Any]]:
     out = []
     for r in rows:
@@ -167,9 +171,29 @@ def write_xlsx(path: str, headers: List[str], rows2d: List[List[Any]]):
     if not HAS_PANDAS:
         print(f"⚠️  pandas/openpyxl not available; skip XLSX: {os.path.basename(path)}")
         return
+    import pandas as pd
     df = pd.DataFrame(rows2d, columns=headers)
     # pandas will handle datatypes and None -> NaN as needed
     df.to_excel(path, index=False)
+    normalize_xlsx(path)
+
+def normalize_xlsx(path: str):
+    """Make XLSX bytes reproducible: fixed zip entry times and fixed docProps created/modified.
+
+    openpyxl stamps both with the current time, so every run would produce a new file.
+    """
+    with zipfile.ZipFile(path) as zin:
+        items = [(info.filename, zin.read(info.filename)) for info in zin.infolist()]
+    tmp = path + ".tmp"
+    with zipfile.ZipFile(tmp, "w") as zout:
+        for name, data in items:
+            if name == "docProps/core.xml":
+                data = XLSX_CORE_TIME_RE.sub(lambda m: m.group(1) + XLSX_FIXED_TIME + m.group(3), data)
+            info = zipfile.ZipInfo(name, date_time=ZIP_FIXED_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            zout.writestr(info, data)
+    os.replace(tmp, path)
 
 def dict_to_xml(tag: str, d: Dict[str, Any]) -> Element:
     """Convert dict to XML element <tag> with simple child elements."""
@@ -209,14 +233,16 @@ def export_table(repo_root: str, table: str, raw_name: str, json_indent: int, ov
         print(f"⛔ Missing: {RAW_FILES[raw_name]}")
         return
 
-    rows = load_json(raw_path)
-    if not isinstance(rows, list):
+    try:
+        rows = load_rows(raw_path)
+    except ValueError:
         print(f"⛔ {RAW_FILES[raw_name]} must be a JSON array")
         return
 
-    # column order
+    # column order (also for JSON/XML, so output does not depend on raw key order)
     order = COLUMN_ORDER[table]
     rows2d = to_rows_in_order(rows, order)
+    rows = [order_row(r, order) for r in rows]
 
     # ensure out dirs
     for ext, d in OUT_DIRS.items():
@@ -1,15 +1,24 @@
 #!/usr/bin/env python3
 # scripts/2_export_api.py
-# Build API JSON from data/raw into api/latest
+# Build API JSON from data/raw into api/latest (+ legacy api/v1)
 
 import argparse
-import json
 import os
+import shutil
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import json_io
+from geo import DEFAULT_ZOOMS, MAX_ZOOM, MIN_ZOOM, build_geo
+from rollups import build_rollups, group_by
 
 RAW_DIR = "data/raw"
 OUT_DIR = "api/latest"
+V1_DIR = "api/v1"
+CLIENT_DIR = "api/latest/client"
+STATS_DIR = "api/latest/stats"
+GEOJSON_DIR = "api/latest/geojson"
+TILES_DIR = "api/latest/tiles"
 
 RAW_FILES = {
     "provinces": os.path.join(RAW_DIR, "provinces.json"),
@@ -29,22 +38,27 @@ ORDER_SUB_DISTRICT = [
     "created_at", "updated_at", "deleted_at"
 ]
 
+# api/v1 (pre-v2 naming): amphure = district, tambon = sub_district.
+# v1 keys are fixed; anything else (lat/long, new columns) is dropped.
+ORDER_V1_PROVINCE = [
+    "id", "name_th", "name_en", "geography_id", "created_at", "updated_at", "deleted_at"
+]
+ORDER_V1_AMPHURE = [
+    "id", "name_th", "name_en", "province_id", "created_at", "updated_at", "deleted_at"
+]
+ORDER_V1_TAMBON = [
+    "id", "zip_code", "name_th", "name_en", "amphure_id",
+    "created_at", "updated_at", "deleted_at"
+]
+
 def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
-def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 def save_json(path: str, data: Any, indent: int, overwrite: bool):
     if (not overwrite) and os.path.exists(path):
         print(f"⚠️  Exists (skip) {path}. Use --overwrite to replace.")
         return
-    with open(path, "w", encoding="utf-8") as f:
-        if indent and indent > 0:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
-        else:
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    json_io.save_json(path, data, indent)
     print(f"✅ Wrote {os.path.relpath(path)}")
 
 def order_keys(d: Dict[str, Any], order: List[str]) -> Dict[str, Any]:
@@ -70,20 +84,15 @@ def build_province_with_children(
         provinces: List[Dict[str, Any]],
         districts: List[Dict[str, Any]],
         sub_districts: List[Dict[str, Any]],
+        dist_by_pid: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+        sub_by_did: Optional[Dict[int, List[Dict[str, Any]]]] = None,
 ) -> List[Dict[str, Any]]:
-    # group districts by province_id
-    dist_by_pid: Dict[int, List[Dict[str, Any]]] = {}
-    for d in districts:
-        pid = d.get("province_id")
-        if isinstance(pid, int):
-            dist_by_pid.setdefault(pid, []).append(d)
-
-    # group sub_districts by district_id
-    sub_by_did: Dict[int, List[Dict[str, Any]]] = {}
-    for s in sub_districts:
-        did = s.get("district_id")
-        if isinstance(did, int):
-            sub_by_did.setdefault(did, []).append(s)
+    # group districts by province_id / sub_districts by district_id
+    # (callers building several outputs pass the groupings in to share them)
+    if dist_by_pid is None:
+        dist_by_pid = group_by(districts, "province_id")
+    if sub_by_did is None:
+        sub_by_did = group_by(sub_districts, "district_id")
 
     result: List[Dict[str, Any]] = []
     for p in provinces:
@@ -139,11 +148,184 @@ def build_sub_district_with_parents(
         out.append(s_clone)
     return out
 
+def pick_keys(d: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
+    """Exactly these keys in this order (missing ones as None); everything else is dropped."""
+    return {k: d.get(k) for k in keys}
+
+def to_v1_tambon(s: Dict[str, Any]) -> Dict[str, Any]:
+    """sub_district row -> v1 tambon row (district_id renamed to amphure_id)."""
+    src = dict(s)
+    src["amphure_id"] = src.get("district_id")
+    return pick_keys(src, ORDER_V1_TAMBON)
+
+def build_v1(
+        provinces_out: List[Dict[str, Any]],
+        districts_out: List[Dict[str, Any]],
+        sub_districts: List[Dict[str, Any]],
+        dist_by_pid: Dict[int, List[Dict[str, Any]]],
+        sub_by_did: Dict[int, List[Dict[str, Any]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Build api/v1 payloads from the same rows/groupings used for api/latest.
+
+    Every v1 row is cut down to its fixed ORDER_V1_* keys, so new raw columns never
+    leak into v1. Each row is converted once and reused by its flat file and the nested file.
+    """
+    tambon_by_id: Dict[Any, Dict[str, Any]] = {}
+    tambons: List[Dict[str, Any]] = []
+    for s in sub_districts:
+        t = to_v1_tambon(s)
+        tambon_by_id[id(s)] = t
+        tambons.append(t)
+
+    amphure_by_id: Dict[Any, Dict[str, Any]] = {}
+    amphures_v1: List[Dict[str, Any]] = []
+    for d in districts_out:
+        a = pick_keys(d, ORDER_V1_AMPHURE)
+        amphure_by_id[d.get("id")] = a
+        amphures_v1.append(a)
+    provinces_v1 = [pick_keys(p, ORDER_V1_PROVINCE) for p in provinces_out]
+
+    nested: List[Dict[str, Any]] = []
+    for p_out, p_v1 in zip(provinces_out, provinces_v1):
+        p_clone = dict(p_v1)
+        amphures: List[Dict[str, Any]] = []
+        for d in dist_by_pid.get(p_out.get("id"), []) or []:
+            d_clone = dict(amphure_by_id.get(d.get("id")) or pick_keys(d, ORDER_V1_AMPHURE))
+            d_clone["tambon"] = [tambon_by_id[id(s)] for s in sub_by_did.get(d.get("id"), []) or []]
+            amphures.append(d_clone)
+        p_clone["amphure"] = amphures
+        nested.append(p_clone)
+
+    return {
+        "province.json": provinces_v1,
+        "amphure.json": amphures_v1,
+        "tambon.json": tambons,
+        "province_with_amphure_tambon.json": nested,
+    }
+
+# Browser bundle (api/latest/client): positional rows, names as indexes into
+# a per-chunk string table. Layout is published in the manifest "fields".
+CLIENT_FIELDS = {
+    "province": ["id", "name_th", "name_en", "geography_id"],
+    "district": ["id", "name_th", "name_en", "sub_districts"],
+    "sub_district": ["id", "zip_code", "name_th", "name_en"],
+}
+CLIENT_FORMAT_VERSION = 1
+
+def build_client_bundle(
+        provinces: List[Dict[str, Any]],
+        dist_by_pid: Dict[int, List[Dict[str, Any]]],
+        sub_by_did: Dict[int, List[Dict[str, Any]]],
+) -> Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]:
+    """Build the manifest and one chunk per province for cascading dropdowns.
+
+    The manifest carries the province list (enough for the first dropdown); a
+    province chunk is fetched only once that province is picked. Within a chunk
+    name_th/name_en are indexes into "strings", which dedupes names repeated
+    between districts and sub-districts. Soft-deleted rows and timestamps are left out.
+    """
+    manifest_rows: List[List[Any]] = []
+    chunks: Dict[int, Dict[str, Any]] = {}
+    for p in provinces:
+        if p.get("deleted_at") is not None:
+            continue
+        pid = p.get("id")
+        manifest_rows.append([pid, p.get("name_th"), p.get("name_en"), p.get("geography_id")])
+
+        strings: List[str] = []
+        string_idx: Dict[str, int] = {}
+
+        def sid(value: Any) -> int:
+            value = "" if value is None else value
+            i = string_idx.get(value)
+            if i is None:
+                i = string_idx[value] = len(strings)
+                strings.append(value)
+            return i
+
+        d_rows: List[List[Any]] = []
+        for d in dist_by_pid.get(pid, []) or []:
+            if d.get("deleted_at") is not None:
+                continue
+            s_rows = [
+                [s.get("id"), s.get("zip_code"), sid(s.get("name_th")), sid(s.get("name_en"))]
+                for s in sub_by_did.get(d.get("id"), []) or []
+                if s.get("deleted_at") is None
+            ]
+            d_rows.append([d.get("id"), sid(d.get("name_th")), sid(d.get("name_en")), s_rows])
+        chunks[pid] = {"strings": strings, "districts": d_rows}
+
+    manifest = {
+        "format": CLIENT_FORMAT_VERSION,
+        "fields": CLIENT_FIELDS,
+        "chunk_path": "province/{id}.json",
+        "provinces": manifest_rows,
+    }
+    return manifest, chunks
+
+def save_json_many(files: Dict[str, Any], indent: int, overwrite: bool, label: str):
+    """Write many small files with one summary line instead of one line per file."""
+    written = 0
+    total = 0
+    for path, data in files.items():
+        if (not overwrite) and os.path.exists(path):
+            continue
+        ensure_dir(os.path.dirname(path))
+        payload = json_io.dumps(data, indent)
+        with open(path, "wb") as f:
+            f.write(payload)
+        written += 1
+        total += len(payload)
+    if written:
+        print(f"✅ Wrote {written} {label} ({total:,} bytes)")
+
+def write_client_bundle(client_dir: str, manifest: Dict[str, Any], chunks: Dict[int, Dict[str, Any]],
+                        overwrite: bool):
+    chunk_dir = os.path.join(client_dir, "province")
+    save_json_many({os.path.join(chunk_dir, f"{pid}.json"): chunk for pid, chunk in chunks.items()},
+                   0, overwrite, f"chunks to {os.path.relpath(chunk_dir)}")
+    # manifest last, so it never points at chunks that are not written yet
+    save_json(os.path.join(client_dir, "manifest.json"), manifest, 0, overwrite)
+
+def write_geo(repo_root: str, geojson: Dict[Any, Dict[str, Any]], tiles: Dict[Tuple[int, int, int], List[List[Any]]],
+              tile_index: Dict[str, Any], overwrite: bool):
+    geo_dir = os.path.join(repo_root, GEOJSON_DIR)
+    save_json_many({os.path.join(geo_dir, "province", f"{pid}.geojson"): fc for pid, fc in geojson.items()},
+                   0, overwrite, f"province FeatureCollections to {os.path.relpath(geo_dir)}")
+
+    tiles_dir = os.path.join(repo_root, TILES_DIR)
+    if overwrite and os.path.isdir(tiles_dir):
+        # points move between builds; a stale tile must not survive
+        shutil.rmtree(tiles_dir)
+    # index.json is written even when no point is located, so the folder must exist
+    ensure_dir(tiles_dir)
+    save_json_many({os.path.join(tiles_dir, str(z), str(x), f"{y}.json"): rows for (z, x, y), rows in tiles.items()},
+                   0, overwrite, f"tiles to {os.path.relpath(tiles_dir)}")
+    save_json(os.path.join(tiles_dir, "index.json"), tile_index, 0, overwrite)
+
+def zoom_range(value: str) -> List[int]:
+    """argparse type for --tile-zooms: 'lo-hi' or a single zoom, within MIN_ZOOM..MAX_ZOOM."""
+    lo, sep, hi = value.partition("-")
+    try:
+        lo_z = int(lo)
+        hi_z = int(hi) if sep else lo_z
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected 'lo-hi' or a single zoom, got '{value}'")
+    if not (MIN_ZOOM <= lo_z <= hi_z <= MAX_ZOOM):
+        raise argparse.ArgumentTypeError(f"need {MIN_ZOOM} <= lo <= hi <= {MAX_ZOOM}, got '{value}'")
+    return list(range(lo_z, hi_z + 1))
+
 def main():
     parser = argparse.ArgumentParser(description="Export API JSON to api/latest from data/raw")
     parser.add_argument("--root", default=None, help="Repo root (default: auto)")
     parser.add_argument("--indent", type=int, default=2, help="JSON indent spaces (0 for compact)")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing api files")
+    parser.add_argument("--no-v1", action="store_true", help="Do not regenerate legacy api/v1 files")
+    parser.add_argument("--no-client", action="store_true", help="Do not write the api/latest/client bundle")
+    parser.add_argument("--no-stats", action="store_true", help="Do not write api/latest/stats aggregates")
+    parser.add_argument("--no-geo", action="store_true", help="Do not write api/latest/geojson and api/latest/tiles")
+    parser.add_argument("--tile-zooms", type=zoom_range, default=DEFAULT_ZOOMS,
+                        help=f"Tile zoom range, e.g. 5-10 ({MIN_ZOOM}-{MAX_ZOOM})")
     args = parser.parse_args()
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -154,9 +336,9 @@ def main():
 
     # Load raw data
     try:
-        provinces = load_json(os.path.join(repo_root, RAW_FILES["provinces"]))
-        districts = load_json(os.path.join(repo_root, RAW_FILES["districts"]))
-        sub_districts = load_json(os.path.join(repo_root, RAW_FILES["sub_districts"]))
+        provinces = json_io.load_rows(os.path.join(repo_root, RAW_FILES["provinces"]))
+        districts = json_io.load_rows(os.path.join(repo_root, RAW_FILES["districts"]))
+        sub_districts = json_io.load_rows(os.path.join(repo_root, RAW_FILES["sub_districts"]))
     except FileNotFoundError as e:
         print(f"⛔ {e}")
         sys.exit(1)
@@ -179,8 +361,12 @@ def main():
     save_json(os.path.join(out_dir, "district.json"), districts_out, args.indent, args.overwrite)
     save_json(os.path.join(out_dir, "sub_district.json"), sub_districts_out, args.indent, args.overwrite)
 
+    # Group once; shared by latest and v1 nested builders
+    dist_by_pid = group_by(districts, "province_id")
+    sub_by_did = group_by(sub_districts, "district_id")
+
     # Nested: province -> districts -> sub_districts
-    nested_prov = build_province_with_children(provinces, districts, sub_districts)
+    nested_prov = build_province_with_children(provinces, districts, sub_districts, dist_by_pid, sub_by_did)
     save_json(
         os.path.join(out_dir, "province_with_district_and_sub_district.json"),
         nested_prov, args.indent, args.overwrite
@@ -193,6 +379,31 @@ def main():
         nested_sub, args.indent, args.overwrite
     )
 
+    # Legacy api/v1: same data, old naming, compact encoding (as originally published)
+    if not args.no_v1:
+        v1_dir = os.path.join(repo_root, V1_DIR)
+        ensure_dir(v1_dir)
+        v1 = build_v1(provinces_out, districts_out, sub_districts, dist_by_pid, sub_by_did)
+        for name, payload in v1.items():
+            save_json(os.path.join(v1_dir, name), payload, 0, args.overwrite)
+
+    # Browser bundle: tiny manifest + lazily fetched per-province chunks
+    if not args.no_client:
+        manifest, chunks = build_client_bundle(provinces, dist_by_pid, sub_by_did)
+        write_client_bundle(os.path.join(repo_root, CLIENT_DIR), manifest, chunks, args.overwrite)
+
+    # Aggregates (counts, zip codes, centroid/bbox) from the same groupings
+    if not args.no_stats:
+        stats_dir = os.path.join(repo_root, STATS_DIR)
+        ensure_dir(stats_dir)
+        for level, rows in build_rollups(provinces, dist_by_pid, sub_by_did).items():
+            save_json(os.path.join(stats_dir, f"{level}.json"), rows, args.indent, args.overwrite)
+
+    # GeoJSON per province + XYZ tiles of sub-district points, same single walk
+    if not args.no_geo:
+        geojson, tiles, tile_index = build_geo(provinces, dist_by_pid, sub_by_did, args.tile_zooms)
+        write_geo(repo_root, geojson, tiles, tile_index, args.overwrite)
+
     print("🏁 Done.")
 
 if __name__ == "__main__":
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# scripts/address_parser.py
+# Batch-resolve free-text Thai addresses ("... ต.xxx อ.yyy จ.zzz 12345") to sub_district ids
+# using indexes built from data/raw.
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import json_io
+
+RAW_DIR = "data/raw"
+
+RAW_FILES = {
+    "provinces": os.path.join(RAW_DIR, "provinces.json"),
+    "districts": os.path.join(RAW_DIR, "districts.json"),
+    "sub_districts": os.path.join(RAW_DIR, "sub_districts.json"),
+}
+
+# ---------------------------
+# Address prefixes per level (longest first so "ตำบล" wins over "ต.")
+# ---------------------------
+PREFIXES = {
+    "sub_district": ["ตำบล", "แขวง", "ต.", "ข."],
+    "district": ["อำเภอ", "เขต", "อ."],
+    "province": ["จังหวัด", "จ."],
+}
+
+# Common province spellings not in name_th
+PROVINCE_ALIASES = {
+    "กรุงเทพฯ": "กรุงเทพมหานคร",
+    "กรุงเทพ": "กรุงเทพมหานคร",
+    "กทม": "กรุงเทพมหานคร",
+}
+
+# Evidence weights; a fully consistent address scores 1.0
+WEIGHTS = {
+    "sub_district": 0.4,
+    "zip_code": 0.25,
+    "district": 0.2,
+    "province": 0.15,
+}
+
+# Resolved evidence tuples kept per index (LRU); noisy input makes the key space unbounded
+CACHE_SIZE = 100_000
+
+# Thai numerals (๐-๙) are common in hand-typed addresses; compared as ASCII
+THAI_DIGITS = str.maketrans("๐๑๒๓๔๕๖๗๘๙", "0123456789")
+
+WS_RE = re.compile(r"\s+")
+PAREN_RE = re.compile(r"\(([^)]*)\)")
+
+# One pass per address: every labelled name and every 5-digit number
+LEVEL_OF_PREFIX = {p: level for level, ps in PREFIXES.items() for p in ps}
+TOKEN_RE = re.compile(
+    r"(?<!\S)(?P<prefix>" + "|".join(re.escape(p) for p in sorted(LEVEL_OF_PREFIX, key=len, reverse=True)) + r")"
+    r"\s*(?P<name>[^\s0-9,]+)"  # name runs until whitespace/digit/comma
+    r"|(?<![0-9])(?P<zip>[0-9]{5})(?![0-9])"
+)
+
+def norm_name(s: str) -> str:
+    """Names are compared without whitespace or trailing punctuation."""
+    return WS_RE.sub("", s).strip(",.")
+
+def name_variants(name: str) -> List[str]:
+    """'ปอภาร  (ปอพาน)' -> ['ปอภาร', 'ปอพาน']"""
+    out = []
+    alias = PAREN_RE.findall(name)
+    base = PAREN_RE.sub("", name)
+    for v in [base] + alias:
+        v = norm_name(v)
+        if v and v not in out:
+            out.append(v)
+    return out
+
+# ---------------------------
+# Index
+# ---------------------------
+
+class AddressIndex:
+    """Lookup tables from data/raw: zip -> sub ids, and per-level name -> sub ids.
+
+    Every lookup returns a frozenset of sub_district ids, so combining evidence
+    from different levels is a set intersection.
+    """
+
+    def __init__(self, provinces: List[Dict[str, Any]], districts: List[Dict[str, Any]],
+                 sub_districts: List[Dict[str, Any]]):
+        provinces = [p for p in provinces if p.get("deleted_at") is None]
+        districts = [d for d in districts if d.get("deleted_at") is None]
+        sub_districts = [s for s in sub_districts if s.get("deleted_at") is None]
+
+        prov_name = {p["id"]: p.get("name_th") or "" for p in provinces}
+        self.dist_of_sub: Dict[int, int] = {}
+        self.prov_of_dist: Dict[int, int] = {d["id"]: d.get("province_id") for d in districts}
+        self.zip_of_sub: Dict[int, Optional[int]] = {}
+
+        subs_by_dist: Dict[int, List[int]] = {}
+        by_zip: Dict[str, List[int]] = {}
+        by_sub_name: Dict[str, List[int]] = {}
+        for s in sub_districts:
+            sid = s["id"]
+            did = s.get("district_id")
+            self.dist_of_sub[sid] = did
+            self.zip_of_sub[sid] = s.get("zip_code")
+            subs_by_dist.setdefault(did, []).append(sid)
+            if s.get("zip_code") is not None:
+                by_zip.setdefault(str(s["zip_code"]), []).append(sid)
+            for v in name_variants(s.get("name_th") or ""):
+                by_sub_name.setdefault(v, []).append(sid)
+
+        subs_by_prov: Dict[int, List[int]] = {}
+        by_dist_name: Dict[str, List[int]] = {}
+        for d in districts:
+            subs = subs_by_dist.get(d["id"], [])
+            subs_by_prov.setdefault(d.get("province_id"), []).extend(subs)
+            names = name_variants(d.get("name_th") or "")
+            for v in list(names):
+                # Bangkok districts are stored as "เขตxxx"; addresses write "เขตxxx" or "xxx"
+                if v.startswith("เขต") and len(v) > 3:
+                    names.append(v[3:])
+                # "อ.เมือง จ.xxx" -> "เมืองxxx" (province disambiguates)
+                pname = norm_name(prov_name.get(d.get("province_id"), ""))
+                if v.startswith("เมือง") and v[len("เมือง"):] == pname:
+                    names.append("เมือง")
+            for v in names:
+                by_dist_name.setdefault(v, []).extend(subs)
+
+        by_prov_name: Dict[str, List[int]] = {}
+        for p in provinces:
+            for v in name_variants(p.get("name_th") or ""):
+                by_prov_name.setdefault(v, []).extend(subs_by_prov.get(p["id"], []))
+        for alias, target in PROVINCE_ALIASES.items():
+            if target in by_prov_name:
+                by_prov_name[alias] = by_prov_name[target]
+
+        self.by_zip: Dict[str, FrozenSet[int]] = {k: frozenset(v) for k, v in by_zip.items()}
+        self.by_name: Dict[str, Dict[str, FrozenSet[int]]] = {
+            "sub_district": {k: frozenset(v) for k, v in by_sub_name.items()},
+            "district": {k: frozenset(v) for k, v in by_dist_name.items()},
+            "province": {k: frozenset(v) for k, v in by_prov_name.items()},
+        }
+        self._cache: "OrderedDict[Tuple[Optional[str], ...], Dict[str, Any]]" = OrderedDict()
+        self.cache_size = CACHE_SIZE
+
+    @classmethod
+    def from_raw(cls, repo_root: str) -> "AddressIndex":
+        return cls(
+            json_io.load_rows(os.path.join(repo_root, RAW_FILES["provinces"])),
+            json_io.load_rows(os.path.join(repo_root, RAW_FILES["districts"])),
+            json_io.load_rows(os.path.join(repo_root, RAW_FILES["sub_districts"])),
+        )
+
+    # ---------------------------
+    # Parsing
+    # ---------------------------
+
+    def extract(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+        """Pull (zip, sub_district, district, province) tokens out of one address.
+
+        Labelled tokens (ต./อ./จ. ...) are taken first; levels without a label are
+        looked up from the unlabelled words at the end of the address.
+        """
+        text = text.translate(THAI_DIGITS)
+        zip_code = None
+        found: Dict[str, Optional[str]] = {"sub_district": None, "district": None, "province": None}
+        # later matches win: the administrative part sits at the end of the address
+        for prefix, name, zip_hit in TOKEN_RE.findall(text):
+            if zip_hit:
+                zip_code = zip_hit
+            else:
+                # TOKEN_RE names hold no whitespace; only a trailing "." can remain
+                found[LEVEL_OF_PREFIX[prefix]] = name.rstrip(".")
+
+        if None in found.values():
+            # unlabelled tail, e.g. "... บางรัก กรุงเทพฯ 10500"
+            words = [w.strip(",.") for w in text.split() if not (w.isascii() and w.isdigit())]
+            for level in ("province", "district", "sub_district"):
+                if found[level] is not None:
+                    continue
+                names = self.by_name[level]
+                for w in reversed(words[-6:]):
+                    if w in names and w not in found.values():
+                        found[level] = w
+                        break
+        return zip_code, found["sub_district"], found["district"], found["province"]
+
+    @staticmethod
+    def best_subset(evidence: List[Tuple[str, FrozenSet[int]]]) -> Tuple[float, Tuple[str, ...], FrozenSet[int]]:
+        """Heaviest subset of evidence that agrees (non-empty intersection).
+
+        Four levels give at most 15 non-empty subsets, so all are tried: one wrong
+        name can no longer outvote zip + district + province that agree with each
+        other. Equal weights go to the subset with more agreeing pieces, then to the
+        one with fewer candidates.
+        """
+        best: Tuple[float, Tuple[str, ...], FrozenSet[int]] = (0.0, (), frozenset())
+        n = len(evidence)
+        for mask in range(1, 1 << n):
+            cands: Optional[FrozenSet[int]] = None
+            weight = 0.0
+            labels = []
+            for i in range(n):
+                if mask >> i & 1:
+                    label, ids = evidence[i]
+                    cands = ids if cands is None else cands & ids
+                    if not cands:
+                        break
+                    weight += WEIGHTS[label]
+                    labels.append(label)
+            if not cands:
+                continue
+            weight = round(weight, 6)
+            if (weight, len(labels), -len(cands)) > (best[0], len(best[1]), -len(best[2])):
+                best = (weight, tuple(labels), cands)
+        return best
+
+    def resolve(self, zip_code: Optional[str], sub: Optional[str], dist: Optional[str],
+                prov: Optional[str]) -> Dict[str, Any]:
+        """Resolve extracted tokens using the heaviest agreeing evidence (LRU-memoized).
+
+        Returns a fresh dict per call; "matched" is a tuple of evidence labels.
+        """
+        key = (zip_code, sub, dist, prov)
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            return dict(hit)
+
+        evidence = [
+            (label, ids) for label, ids in (
+                ("sub_district", self.by_name["sub_district"].get(sub) if sub else None),
+                ("zip_code", self.by_zip.get(zip_code) if zip_code else None),
+                ("district", self.by_name["district"].get(dist) if dist else None),
+                ("province", self.by_name["province"].get(prov) if prov else None),
+            ) if ids
+        ]
+        score, matched, cands = self.best_subset(evidence)
+
+        if not cands:
+            out = {"sub_district_id": None, "district_id": None, "province_id": None,
+                   "zip_code": None, "confidence": 0.0, "matched": ()}
+        else:
+            sid = min(cands)
+            did = self.dist_of_sub.get(sid)
+            out = {
+                "sub_district_id": sid,
+                "district_id": did,
+                "province_id": self.prov_of_dist.get(did),
+                "zip_code": self.zip_of_sub.get(sid),
+                # ambiguity splits the confidence between remaining candidates
+                "confidence": round(score / len(cands), 4),
+                "matched": matched,
+            }
+        self._cache[key] = out
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return dict(out)
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        return self.resolve(*self.extract(text))
+
+    def parse_many(self, texts: Iterable[str]) -> List[Dict[str, Any]]:
+        return [self.resolve(*self.extract(t)) for t in texts]
+
+# ---------------------------
+# Batch / parallel
+# ---------------------------
+
+_WORKER_INDEX: Optional[AddressIndex] = None
+
+def _init_worker(repo_root: str):
+    global _WORKER_INDEX
+    _WORKER_INDEX = AddressIndex.from_raw(repo_root)
+
+def _parse_chunk(texts: List[str]) -> List[Dict[str, Any]]:
+    return _WORKER_INDEX.parse_many(texts)
+
+def parse_batch(texts: List[str], repo_root: str, workers: int = 1, chunk_size: int = 20000,
+                index: Optional[AddressIndex] = None) -> List[Dict[str, Any]]:
+    """Parse a list of addresses; results are in input order.
+
+    workers > 1 splits the list into chunks for a process pool, each worker
+    building its own index once.
+    """
+    if workers <= 1 or len(texts) <= chunk_size:
+        index = index or AddressIndex.from_raw(repo_root)
+        return index.parse_many(texts)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    out: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(repo_root,)) as ex:
+        for res in ex.map(_parse_chunk, chunks):
+            out.extend(res)
+    return out
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+
+# The approach TOKEN_RE replaced: one search per level and one for the zip
+_PER_LEVEL_RES = {
+    level: re.compile(r"(?<!\S)(?:" + "|".join(re.escape(p) for p in ps) + r")\s*([^\s0-9,]+)")
+    for level, ps in PREFIXES.items()
+}
+_ZIP_RE = re.compile(r"(?<![0-9])([0-9]{5})(?![0-9])")
+
+def _extract_per_level(text: str) -> Tuple[Optional[str], ...]:
+    text = text.translate(THAI_DIGITS)
+    out = []
+    for level in ("sub_district", "district", "province"):
+        hits = _PER_LEVEL_RES[level].findall(text)
+        out.append(hits[-1].rstrip(".") if hits else None)
+    z = _ZIP_RE.findall(text)
+    return (z[-1] if z else None, *out)
+
+def sample_addresses(repo_root: str, n: int, seed: int = 0) -> List[Tuple[str, int]]:
+    """n synthetic (address, expected sub_district_id) pairs: labelled, unlabelled and Thai-numeral forms."""
+    provinces = {p["id"]: p for p in json_io.load_rows(os.path.join(repo_root, RAW_FILES["provinces"]))}
+    districts = {d["id"]: d for d in json_io.load_rows(os.path.join(repo_root, RAW_FILES["districts"]))}
+    subs = [s for s in json_io.load_rows(os.path.join(repo_root, RAW_FILES["sub_districts"]))
+            if s.get("deleted_at") is None and s.get("zip_code") and s.get("district_id") in districts]
+    rnd = random.Random(seed)
+    to_thai = str.maketrans("0123456789", "๐๑๒๓๔๕๖๗๘๙")
+    out = []
+    for i in range(n):
+        s = rnd.choice(subs)
+        d = districts[s["district_id"]]
+        p = provinces.get(d.get("province_id"), {})
+        sub_name = name_variants(s["name_th"])[0]
+        dist_name = name_variants(d["name_th"])[0]
+        prov_name = name_variants(p.get("name_th") or "")[0]
+        bkk = dist_name.startswith("เขต")
+        house = f"{rnd.randint(1, 999)}/{rnd.randint(1, 99)} หมู่ {rnd.randint(1, 12)}"
+        form = i % 3
+        if form == 0:
+            sub_p, dist_p = ("แขวง", "") if bkk else ("ต.", "อ.")
+            text = f"{house} {sub_p}{sub_name} {dist_p}{dist_name} จ.{prov_name} {s['zip_code']}"
+        elif form == 1:
+            text = f"{house} {sub_name} {dist_name} {prov_name} {s['zip_code']}"
+        else:
+            text = f"{house} ตำบล{sub_name} อำเภอ{dist_name} จังหวัด{prov_name} {s['zip_code']}".translate(to_thai)
+        out.append((text, s["id"]))
+    return out
+
+def bench(repo_root: str, n: int) -> float:
+    """Print extract/parse timings on n synthetic addresses; returns full-parse µs per address."""
+    pairs = sample_addresses(repo_root, n)
+    texts = [t for t, _ in pairs]
+    index = AddressIndex.from_raw(repo_root)
+
+    t0 = time.perf_counter()
+    for t in texts:
+        _extract_per_level(t)
+    per_level = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for t in texts:
+        index.extract(t)
+    single = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    results = index.parse_many(texts)
+    full = time.perf_counter() - t0
+
+    hits = sum(1 for r, (_, sid) in zip(results, pairs) if r["sub_district_id"] == sid)
+    us = lambda sec: sec / n * 1e6
+    print(f"• extract, one regex per level: {us(per_level):.2f} µs/address")
+    print(f"• extract, single TOKEN_RE pass: {us(single):.2f} µs/address")
+    print(f"• full parse (extract + resolve, cached): {us(full):.2f} µs/address, {n / full:,.0f} addresses/s")
+    print(f"• resolved to the source sub-district: {hits / n:.1%} ({n - hits:,} ambiguous or missed)")
+    return us(full)
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve free-text Thai addresses to sub_district ids")
+    parser.add_argument("input", nargs="?", default="-", help="Text file, one address per line (default: stdin)")
+    parser.add_argument("--root", default=None, help="Repo root (default: auto)")
+    parser.add_argument("--out", default="-", help="Output JSON Lines file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Addresses per worker task")
+    parser.add_argument("--bench", type=int, default=0, metavar="N",
+                        help="Benchmark on N synthetic addresses instead of parsing input")
+    parser.add_argument("--target-us", type=float, default=20.0, help="Fail --bench if a full parse is slower")
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = args.root or os.path.abspath(os.path.join(script_dir, ".."))
+
+    if args.bench:
+        us = bench(repo_root, args.bench)
+        if us > args.target_us:
+            print(f"⛔ above target {args.target_us:.1f} µs/address")
+            sys.exit(1)
+        print(f"✅ within target {args.target_us:.1f} µs/address")
+        return
+
+    if args.input == "-":
+        texts = sys.stdin.read().splitlines()
+    else:
+        with open(args.input, "r", encoding="utf-8") as f:
+            texts = f.read().splitlines()
+
+    results = parse_batch(texts, repo_root, args.workers, args.chunk_size)
+
+    lines = []
+    for text, res in zip(texts, results):
+        row = {"input": text}
+        row.update(res)
+        lines.append(json_io.dumps(row, 0))
+    payload = b"\n".join(lines) + (b"\n" if lines else b"")
+    if args.out == "-":
+        sys.stdout.buffer.write(payload)
+    else:
+        with open(args.out, "wb") as f:
+            f.write(payload)
+        print(f"✅ Wrote {len(lines)} rows -> {args.out}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
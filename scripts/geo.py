@@ -0,0 +1,93 @@
+# scripts/geo.py
+# GeoJSON per province and XYZ tiles of slim sub-district points.
+# Used by 2_export_api.py (api/latest/geojson, api/latest/tiles).
+
+import math
+from typing import Any, Dict, List, Tuple
+
+# Web-mercator latitude limit
+MAX_LAT = 85.05112878
+
+DEFAULT_ZOOMS = list(range(5, 11))
+# One tile row per point; names/zip come from geojson/ or the client bundle by id
+TILE_FIELDS = ["id", "long", "lat"]
+# Accepted --tile-zooms bounds (beyond ~20 a tile is smaller than a building)
+MIN_ZOOM = 0
+MAX_ZOOM = 20
+
+def tile_xy(lat: float, lon: float, z: int) -> Tuple[int, int]:
+    """Slippy-map tile (x, y) containing the point at zoom z."""
+    lat = max(-MAX_LAT, min(MAX_LAT, lat))
+    n = 1 << z
+    x = int((lon + 180.0) / 360.0 * n)
+    r = math.radians(lat)
+    y = int((1.0 - math.log(math.tan(r) + 1.0 / math.cos(r)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+def feature(s: Dict[str, Any], province_id: Any) -> Dict[str, Any]:
+    return {
+        "type": "Feature",
+        "id": s.get("id"),
+        # GeoJSON order is [longitude, latitude]
+        "geometry": {"type": "Point", "coordinates": [s["long"], s["lat"]]},
+        "properties": {
+            "id": s.get("id"),
+            "zip_code": s.get("zip_code"),
+            "name_th": s.get("name_th"),
+            "name_en": s.get("name_en"),
+            "district_id": s.get("district_id"),
+            "province_id": province_id,
+        },
+    }
+
+def feature_collection(features: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"type": "FeatureCollection", "features": features}
+
+def build_geo(
+        provinces: List[Dict[str, Any]],
+        dist_by_pid: Dict[int, List[Dict[str, Any]]],
+        sub_by_did: Dict[int, List[Dict[str, Any]]],
+        zooms: List[int] = DEFAULT_ZOOMS,
+) -> Tuple[Dict[Any, Dict[str, Any]], Dict[Tuple[int, int, int], List[List[Any]]], Dict[str, Any]]:
+    """One pass over the province -> district -> sub_district groupings.
+
+    Each located, non-deleted sub-district becomes one Feature in its province
+    collection and one slim [id, long, lat] row (TILE_FIELDS) in the tile it falls
+    in at every zoom level; the full Feature is not repeated per zoom.
+    Returns (province_id -> FeatureCollection, (z, x, y) -> rows, tile index).
+    """
+    by_province: Dict[Any, List[Dict[str, Any]]] = {}
+    by_tile: Dict[Tuple[int, int, int], List[List[Any]]] = {}
+    for p in provinces:
+        if p.get("deleted_at") is not None:
+            continue
+        pid = p.get("id")
+        feats = by_province.setdefault(pid, [])
+        for d in dist_by_pid.get(pid, []) or []:
+            if d.get("deleted_at") is not None:
+                continue
+            for s in sub_by_did.get(d.get("id"), []) or []:
+                if s.get("deleted_at") is not None or s.get("lat") is None or s.get("long") is None:
+                    continue
+                feats.append(feature(s, pid))
+                row = [s.get("id"), s["long"], s["lat"]]
+                lat = float(s["lat"])
+                lon = float(s["long"])
+                for z in zooms:
+                    x, y = tile_xy(lat, lon, z)
+                    by_tile.setdefault((z, x, y), []).append(row)
+
+    index: Dict[str, Any] = {
+        "zooms": list(zooms),
+        "path": "{z}/{x}/{y}.json",
+        "fields": TILE_FIELDS,
+        "tiles": {str(z): [] for z in zooms},
+    }
+    for (z, x, y), rows in sorted(by_tile.items()):
+        index["tiles"][str(z)].append([x, y, len(rows)])
+
+    return (
+        {pid: feature_collection(feats) for pid, feats in by_province.items()},
+        by_tile,
+        index,
+    )
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# scripts/history.py
+# Append-only version store for data/raw with as_of(date) lookups.
+# Stores only rows that changed between snapshots, one JSON line per version.
+
+import argparse
+import os
+import subprocess
+import sys
+from bisect import bisect_right
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+
+import json_io
+
+RAW_DIR = "data/raw"
+HISTORY_DIR = "data/history"
+TABLES = ["geographies", "provinces", "districts", "sub_districts"]
+
+# Dates without a timezone are read as Thai time, like the timestamps in data/raw
+DEFAULT_TZ = timezone(timedelta(hours=7))
+
+# ---------------------------
+# Helpers
+# ---------------------------
+
+def parse_time(s: Optional[str]) -> Optional[datetime]:
+    """ISO8601 date or date-time -> aware datetime (None stays None)."""
+    if not s:
+        return None
+    dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=DEFAULT_TZ)
+    return dt
+
+def to_ts(s: Optional[str]) -> float:
+    """Sort key for a version start; None (unknown start) sorts first."""
+    dt = parse_time(s)
+    return dt.timestamp() if dt else float("-inf")
+
+def history_path(repo_root: str, table: str) -> str:
+    return os.path.join(repo_root, HISTORY_DIR, f"{table}.jsonl")
+
+def read_versions(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        return [json_io.loads(line) for line in f if line.strip()]
+
+def commit_time(repo_root: str, rev: str) -> str:
+    """Committer date of a revision (ISO 8601): when that snapshot of data/raw became current."""
+    return subprocess.run(
+        ["git", "-C", repo_root, "show", "-s", "--format=%cI", rev],
+        check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+def load_snapshot(repo_root: str, rev: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Read data/raw from the working tree, or from a git revision."""
+    out = {}
+    for table in TABLES:
+        rel = os.path.join(RAW_DIR, f"{table}.json")
+        if rev:
+            data = subprocess.run(
+                ["git", "-C", repo_root, "show", f"{rev}:{rel}"],
+                check=True, capture_output=True,
+            ).stdout
+            out[table] = json_io.loads(data)
+        else:
+            out[table] = json_io.load_rows(os.path.join(repo_root, rel))
+    return out
+
+# ---------------------------
+# Store
+# ---------------------------
+
+class HistoryStore:
+    """Versions per table and id, with start times sorted for bisect.
+
+    A version record is {"id", "valid_from", "row"}; "row" is null when the id
+    vanished from a snapshot (hard delete). A version is valid from valid_from
+    until the next version of the same id, or until its own deleted_at.
+    """
+
+    def __init__(self, repo_root: str):
+        self.repo_root = repo_root
+        self.versions: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {}
+        self.starts: Dict[str, Dict[Any, List[float]]] = {}
+        for table in TABLES:
+            self._index(table, read_versions(history_path(repo_root, table)))
+
+    def _index(self, table: str, records: List[Dict[str, Any]]):
+        by_id: Dict[Any, List[Dict[str, Any]]] = {}
+        for rec in records:
+            by_id.setdefault(rec["id"], []).append(rec)
+        starts: Dict[Any, List[float]] = {}
+        for rid, recs in by_id.items():
+            recs.sort(key=lambda r: to_ts(r["valid_from"]))  # stable: file order breaks ties
+            starts[rid] = [to_ts(r["valid_from"]) for r in recs]
+        self.versions[table] = by_id
+        self.starts[table] = starts
+
+    def ingest(self, snapshot: Dict[str, List[Dict[str, Any]]], at: str) -> Dict[str, int]:
+        """Append versions for rows that differ from their latest stored version.
+
+        at is when the snapshot was taken; it dates edits that did not move
+        updated_at and hard deletes. A new version never starts before the one it
+        replaces, so a re-added row with an old updated_at still wins over its tombstone.
+        """
+        added = {}
+        for table in TABLES:
+            rows = snapshot.get(table, [])
+            latest = {rid: recs[-1]["row"] for rid, recs in self.versions[table].items()}
+            latest_start = {rid: recs[-1]["valid_from"] for rid, recs in self.versions[table].items()}
+
+            def clamp(rid: Any, start: Optional[str]) -> Optional[str]:
+                prev = latest_start.get(rid)
+                return prev if to_ts(start) < to_ts(prev) else start
+            new: List[Dict[str, Any]] = []
+            seen = set()
+            for row in rows:
+                rid = row.get("id")
+                seen.add(rid)
+                if rid in latest and latest[rid] == row:
+                    continue
+                if rid in latest:
+                    # trust updated_at only if it moved past the previous version's start
+                    # (a re-added row keeps its old updated_at); otherwise date it by the snapshot
+                    prev = latest[rid] or {}
+                    updated = row.get("updated_at")
+                    moved = (updated and updated != prev.get("updated_at")
+                             and to_ts(updated) >= to_ts(latest_start[rid]))
+                    start = clamp(rid, updated if moved else at)
+                else:
+                    # first sighting: best known start is creation
+                    start = row.get("created_at")
+                new.append({"id": rid, "valid_from": start, "row": row})
+            for rid, row in latest.items():
+                if rid not in seen and row is not None:
+                    new.append({"id": rid, "valid_from": clamp(rid, at), "row": None})
+            if new:
+                path = history_path(self.repo_root, table)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "ab") as f:
+                    for rec in new:
+                        f.write(json_io.dumps(rec, 0) + b"\n")
+                self._index(table, read_versions(path))
+            added[table] = len(new)
+        return added
+
+    def get(self, table: str, rid: Any, as_of: str) -> Optional[Dict[str, Any]]:
+        """Row as it was at as_of, or None if it did not exist (or was deleted)."""
+        return self._get_ts(table, rid, to_ts(as_of))
+
+    def _get_ts(self, table: str, rid: Any, t: float) -> Optional[Dict[str, Any]]:
+        starts = self.starts[table].get(rid)
+        if not starts:
+            return None
+        i = bisect_right(starts, t) - 1
+        if i < 0:
+            return None
+        row = self.versions[table][rid][i]["row"]
+        if row is None:
+            return None
+        deleted = row.get("deleted_at")
+        if deleted and to_ts(deleted) <= t:
+            return None
+        return row
+
+    def snapshot(self, as_of: str) -> Dict[str, List[Dict[str, Any]]]:
+        """All tables as of a date, rows ordered by id."""
+        t = to_ts(as_of)
+        out = {}
+        for table in TABLES:
+            rows = []
+            for rid in sorted(self.starts[table]):
+                row = self._get_ts(table, rid, t)
+                if row is not None:
+                    rows.append(row)
+            out[table] = rows
+        return out
+
+# ---------------------------
+# Export a historical snapshot with the normal pipeline
+# ---------------------------
+
+def export_snapshot(store: HistoryStore, as_of: str, out_root: str, indent: int):
+    """Write out_root/data/raw as of the date, then run the format and API exporters on it."""
+    raw_dir = os.path.join(out_root, RAW_DIR)
+    os.makedirs(raw_dir, exist_ok=True)
+    for table, rows in store.snapshot(as_of).items():
+        json_io.save_json(os.path.join(raw_dir, f"{table}.json"), rows, indent)
+        print(f"✅ {table}: {len(rows)} rows as of {as_of}")
+    scripts = os.path.dirname(os.path.abspath(__file__))
+    for script in ["1_export_file_format.py", "2_export_api.py"]:
+        cmd = [sys.executable, os.path.join(scripts, script), "--root", out_root, "--overwrite"]
+        print(f"\n🚀 Running: {' '.join(cmd)}")
+        subprocess.run(cmd, check=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned history of data/raw with as-of queries")
+    parser.add_argument("--root", default=None, help="Repo root (default: auto)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_ingest = sub.add_parser("ingest", help="Append changed rows from a data/raw snapshot")
+    p_ingest.add_argument("--rev", action="append", default=[],
+                          help="Git revision to read data/raw from (repeatable, oldest first); default: working tree")
+    p_ingest.add_argument("--at", default=None,
+                          help="Working-tree ingest only: time for changes without timestamps / hard deletes "
+                               "(default: now; --rev snapshots use the commit time)")
+
+    p_get = sub.add_parser("as-of", help="Print one row as of a date")
+    p_get.add_argument("table", choices=TABLES)
+    p_get.add_argument("id", type=int)
+    p_get.add_argument("date", help="ISO date or date-time, e.g. 2021-01-01")
+
+    p_export = sub.add_parser("export", help="Export a historical snapshot in all formats")
+    p_export.add_argument("date", help="ISO date or date-time, e.g. 2021-01-01")
+    p_export.add_argument("--out", required=True, help="Output root (gets data/raw, formats/, api/)")
+    p_export.add_argument("--indent", type=int, default=2, help="JSON indent for the snapshot raw files")
+
+    args = parser.parse_args()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = args.root or os.path.abspath(os.path.join(script_dir, ".."))
+    store = HistoryStore(repo_root)
+
+    if args.cmd == "ingest":
+        if args.rev and args.at:
+            parser.error("--at applies to working-tree ingests; --rev snapshots are dated by their commit")
+        for rev in args.rev or [None]:
+            try:
+                snapshot = load_snapshot(repo_root, rev)
+                at = commit_time(repo_root, rev) if rev else (
+                    args.at or datetime.now(DEFAULT_TZ).isoformat(timespec="seconds"))
+            except subprocess.CalledProcessError as e:
+                err = e.stderr if isinstance(e.stderr, str) else e.stderr.decode("utf-8", "replace")
+                print(f"⛔ Cannot read {rev}: {err.strip()}")
+                sys.exit(1)
+            added = store.ingest(snapshot, at)
+            label = f"{rev} ({at})" if rev else "working tree"
+            print(f"✅ {label}: " + ", ".join(f"{t} +{n}" for t, n in added.items()))
+    elif args.cmd == "as-of":
+        row = store.get(args.table, args.id, args.date)
+        if row is None:
+            print(f"⛔ {args.table} id={args.id} did not exist on {args.date}")
+            sys.exit(1)
+        sys.stdout.buffer.write(json_io.dumps(row, 2) + b"\n")
+    elif args.cmd == "export":
+        export_snapshot(store, args.date, os.path.abspath(args.out), args.indent)
+        print("🏁 Done.")
+
+if __name__ == "__main__":
+    main()
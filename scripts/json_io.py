@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# scripts/json_io.py
+# Shared JSON load/save for the pipeline scripts.
+# Uses orjson or msgspec when installed, falls back to stdlib json.
+# Output is byte-for-byte identical to json.dump(ensure_ascii=False, indent=N):
+# fast backends write exponent floats as 1e16 / 1.5e-7 where stdlib writes
+# 1e+16 / 1.5e-07, and NaN/Infinity as null, so any payload that may contain
+# either is re-encoded with stdlib.
+
+import argparse
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+# ---------------------------
+# Optional fast backends
+# ---------------------------
+HAS_ORJSON = True
+try:
+    import orjson
+except Exception:
+    HAS_ORJSON = False
+
+HAS_MSGSPEC = True
+try:
+    import msgspec
+except Exception:
+    HAS_MSGSPEC = False
+
+def available_backends() -> List[str]:
+    out = []
+    if HAS_ORJSON:
+        out.append("orjson")
+    if HAS_MSGSPEC:
+        out.append("msgspec")
+    out.append("json")
+    return out
+
+def _pick_backend() -> str:
+    # THAI_PROVINCE_JSON=json forces stdlib (e.g. to compare outputs)
+    wanted = os.environ.get("THAI_PROVINCE_JSON", "").strip().lower()
+    avail = available_backends()
+    if wanted:
+        if wanted not in avail:
+            print(f"⚠️  JSON backend '{wanted}' not available; using '{avail[0]}'")
+            return avail[0]
+        return wanted
+    return avail[0]
+
+BACKEND = _pick_backend()
+
+# msgspec decoders are reusable; build once
+if HAS_MSGSPEC:
+    _ROWS_DECODER = msgspec.json.Decoder(List[Dict[str, Any]])
+    _ANY_DECODER = msgspec.json.Decoder()
+    _ENCODER = msgspec.json.Encoder()
+
+def set_backend(name: str):
+    """Switch backend at runtime (raises ValueError if not installed)."""
+    global BACKEND
+    if name not in available_backends():
+        raise ValueError(f"JSON backend '{name}' not available")
+    BACKEND = name
+
+# ---------------------------
+# Decode
+# ---------------------------
+
+def loads(data: bytes, backend: str = None) -> Any:
+    backend = backend or BACKEND
+    if backend == "orjson":
+        return orjson.loads(data)
+    if backend == "msgspec":
+        return _ANY_DECODER.decode(data)
+    return json.loads(data)
+
+def load_json(path: str) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+def load_rows(path: str) -> List[Dict[str, Any]]:
+    """Load a raw table (JSON array of objects). Raises ValueError on any other shape."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if HAS_MSGSPEC and BACKEND != "json":
+        # typed decode whenever msgspec is installed (even if orjson is the encoder):
+        # shape is checked while parsing
+        try:
+            return _ROWS_DECODER.decode(data)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"{os.path.basename(path)} must be a JSON array of objects ({e})")
+    rows = loads(data)
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise ValueError(f"{os.path.basename(path)} must be a JSON array of objects")
+    return rows
+
+# ---------------------------
+# Encode
+# ---------------------------
+
+# A digit followed by e/E: an exponent float (or, rarely, text inside a string,
+# which only costs a stdlib re-encode)
+_EXPONENT_RE = re.compile(rb"[0-9][eE]")
+
+def _has_nonfinite(data: Any) -> bool:
+    """True if any float in the payload is NaN or +/-inf (fast backends write those as null)."""
+    stack = [data]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, float):
+            if v != v or v in (math.inf, -math.inf):
+                return True
+        elif isinstance(v, dict):
+            stack.extend(v.values())
+        elif isinstance(v, (list, tuple)):
+            stack.extend(v)
+    return False
+
+def _dumps_stdlib(data: Any, indent: int) -> bytes:
+    if indent and indent > 0:
+        s = json.dumps(data, ensure_ascii=False, indent=indent)
+    else:
+        s = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return s.encode("utf-8")
+
+def dumps(data: Any, indent: int, backend: str = None) -> bytes:
+    """Encode to UTF-8 bytes, same layout as json.dumps(ensure_ascii=False)."""
+    backend = backend or BACKEND
+    # orjson only knows indent 2; msgspec.json.format handles any indent
+    try:
+        buf = None
+        if backend == "orjson" and (not indent or indent == 2):
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        elif backend == "msgspec":
+            buf = _ENCODER.encode(data)
+            if indent and indent > 0:
+                buf = msgspec.json.format(buf, indent=indent)
+        # null in the output may be a NaN/inf that stdlib writes as NaN/Infinity
+        if buf is not None and not _EXPONENT_RE.search(buf) and not (b"null" in buf and _has_nonfinite(data)):
+            return buf
+    except Exception:
+        # big ints, non-str keys ... let stdlib decide
+        pass
+    return _dumps_stdlib(data, indent)
+
+def save_json(path: str, data: Any, indent: int):
+    with open(path, "wb") as f:
+        f.write(dumps(data, indent))
+
+# ---------------------------
+# Self check: fast backends must match stdlib byte-for-byte
+# ---------------------------
+
+# Values whose text differs between encoders (exponent floats, float edge cases)
+EDGE_PAYLOADS = [
+    {"lat": 1e16, "long": 1.5e-07, "big": 1.7976931348623157e308, "small": 5e-324},
+    [0.1, 0.0001, 1e-05, 123456789012345.6, 1e15, -0.0, 2.5e+21],
+    {"name_en": "Ban 2e", "zip_code": 10200, "nested": [{"x": 3.0e-9}]},
+    [float("nan"), float("inf"), float("-inf"), None],
+    {"lat": float("nan"), "long": 100.5, "deleted_at": None},
+]
+
+def check_identical(data: Any, indents=(2, 0, 4)) -> List[str]:
+    """Return a list of mismatches between available backends and stdlib."""
+    problems = []
+    for indent in indents:
+        ref = _dumps_stdlib(data, indent)
+        for backend in available_backends():
+            if backend == "json":
+                continue
+            out = dumps(data, indent, backend=backend)
+            if out != ref:
+                problems.append(f"{backend} indent={indent}: output differs from stdlib json")
+            # NaN != NaN, and fast decoders reject NaN/Infinity literals: only encoding is compared
+            if not _has_nonfinite(data) and loads(out, backend=backend) != data:
+                problems.append(f"{backend} indent={indent}: round-trip differs")
+    return problems
+
+def _tree_bytes(root: str) -> Dict[str, bytes]:
+    out = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                out[os.path.relpath(path, root)] = f.read()
+    return out
+
+def compare_export(repo_root: str) -> List[str]:
+    """Run 2_export_api.py on a copy of data/raw per backend; every api/ tree must equal stdlib's."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "2_export_api.py")
+    trees = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in available_backends():
+            root = os.path.join(tmp, backend)
+            shutil.copytree(os.path.join(repo_root, "data/raw"), os.path.join(root, "data/raw"))
+            env = dict(os.environ, THAI_PROVINCE_JSON=backend)
+            subprocess.run([sys.executable, script, "--root", root, "--overwrite"],
+                           env=env, check=True, stdout=subprocess.DEVNULL)
+            trees[backend] = _tree_bytes(os.path.join(root, "api"))
+    ref = trees["json"]
+    problems = []
+    for backend, tree in trees.items():
+        if backend == "json":
+            continue
+        for rel in sorted(set(ref) | set(tree)):
+            if ref.get(rel) != tree.get(rel):
+                problems.append(f"{backend}: api/{rel} differs from stdlib json")
+    print(f"• Compared {len(ref)} api files across: {', '.join(trees)}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Check fast JSON backends against stdlib json")
+    parser.add_argument("--root", default=None, help="Repo root (default: auto)")
+    parser.add_argument("--export", action="store_true",
+                        help="Also run 2_export_api.py with each backend and compare the api/ trees")
+    parser.add_argument("paths", nargs="*", help="JSON files to check (default: data/raw/*.json)")
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = args.root or os.path.abspath(os.path.join(script_dir, ".."))
+    paths = args.paths or [
+        os.path.join(repo_root, "data/raw", name)
+        for name in ["geographies.json", "provinces.json", "districts.json", "sub_districts.json"]
+    ]
+
+    print(f"• Backends: {', '.join(available_backends())} (active: {BACKEND})")
+    failed = False
+    for path in paths:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+        problems = check_identical(data)
+        for p in problems:
+            print(f"❌ {os.path.relpath(path, repo_root)}: {p}")
+        if problems:
+            failed = True
+        else:
+            print(f"✅ {os.path.relpath(path, repo_root)}")
+
+    problems = [p for data in EDGE_PAYLOADS for p in check_identical(data)]
+    for p in problems:
+        print(f"❌ edge-case floats: {p}")
+    if problems:
+        failed = True
+    else:
+        print("✅ edge-case floats")
+
+    if args.export:
+        if len(available_backends()) == 1:
+            print("⚠️  No fast backend installed; nothing to compare (pip install orjson msgspec)")
+        else:
+            problems = compare_export(repo_root)
+            for p in problems[:50]:
+                print(f"❌ {p}")
+            if problems:
+                failed = True
+            else:
+                print("✅ api/ output identical for every backend")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
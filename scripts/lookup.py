@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# scripts/lookup.py
+# Id lookups over data/raw that only pay for the tables they touch.
+# geographies/provinces come from precompiled constants (small_tables.py);
+# districts/sub_districts are parsed on first access.
+
+import os
+import sys
+
+# Cold-start budget: only os/sys at import time. argparse/hashlib/subprocess/json_io are
+# imported inside the functions that use them, and the module is left unannotated
+# because importing typing alone costs more than the whole first lookup.
+
+RAW_DIR = "data/raw"
+DEFAULT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CONSTANTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "small_tables.py")
+
+RAW_FILES = {
+    "geographies": os.path.join(RAW_DIR, "geographies.json"),
+    "provinces": os.path.join(RAW_DIR, "provinces.json"),
+    "districts": os.path.join(RAW_DIR, "districts.json"),
+    "sub_districts": os.path.join(RAW_DIR, "sub_districts.json"),
+}
+
+# Tables compiled into small_tables.py (name -> constant)
+CONSTANT_TABLES = {"geographies": "GEOGRAPHIES", "provinces": "PROVINCES"}
+
+# Children lookups: table -> FK column
+PARENT_KEYS = {"provinces": "geography_id", "districts": "province_id", "sub_districts": "district_id"}
+
+_rows = {}       # table -> rows in file order
+_by_id = {}      # table -> {id: row}
+_by_parent = {}  # table -> {parent id: [rows]}
+_root = DEFAULT_ROOT
+
+def set_root(repo_root):
+    """Point lookups at another checkout; drops anything already loaded."""
+    global _root
+    _root = repo_root
+    _rows.clear()
+    _by_id.clear()
+    _by_parent.clear()
+
+# ---------------------------
+# Lazy table loading
+# ---------------------------
+
+def _load(table):
+    if table in CONSTANT_TABLES and _root == DEFAULT_ROOT:
+        try:
+            import small_tables
+            return getattr(small_tables, CONSTANT_TABLES[table])
+        except ImportError:
+            pass
+    # json_io pulls in orjson/msgspec; only needed once a table is parsed
+    import json_io
+    return json_io.load_rows(os.path.join(_root, RAW_FILES[table]))
+
+def rows(table):
+    """All rows of a table in file order (shared; do not mutate)."""
+    out = _rows.get(table)
+    if out is None:
+        out = _rows[table] = _load(table)
+    return out
+
+def _index(table):
+    idx = _by_id.get(table)
+    if idx is None:
+        idx = _by_id[table] = {r["id"]: r for r in rows(table)}
+    return idx
+
+def _children(table, parent_id):
+    groups = _by_parent.get(table)
+    if groups is None:
+        groups = {}
+        key = PARENT_KEYS[table]
+        for r in rows(table):
+            groups.setdefault(r.get(key), []).append(r)
+        _by_parent[table] = groups
+    return groups.get(parent_id, [])
+
+def loaded_tables():
+    return [t for t in RAW_FILES if t in _rows]
+
+# ---------------------------
+# Public lookups
+# ---------------------------
+
+def geography(geography_id):
+    return _index("geographies").get(geography_id)
+
+def province(province_id):
+    return _index("provinces").get(province_id)
+
+def district(district_id):
+    return _index("districts").get(district_id)
+
+def sub_district(sub_district_id):
+    return _index("sub_districts").get(sub_district_id)
+
+def provinces_of(geography_id):
+    return _children("provinces", geography_id)
+
+def districts_of(province_id):
+    return _children("districts", province_id)
+
+def sub_districts_of(district_id):
+    return _children("sub_districts", district_id)
+
+# ---------------------------
+# Precompiled constants
+# ---------------------------
+
+def _source_digest(repo_root):
+    import hashlib
+    h = hashlib.sha256()
+    for table in CONSTANT_TABLES:
+        with open(os.path.join(repo_root, RAW_FILES[table]), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def build_constants(repo_root, path=CONSTANTS_FILE):
+    """Write small_tables.py: plain literals, so import is a .pyc load instead of a JSON parse."""
+    import json_io
+    lines = [
+        "# scripts/small_tables.py",
+        "# Generated by scripts/lookup.py --build-constants from data/raw. Do not edit.",
+        "",
+        f"SOURCE_SHA256 = {_source_digest(repo_root)!r}",
+        "",
+    ]
+    for table, const in CONSTANT_TABLES.items():
+        data = json_io.load_rows(os.path.join(repo_root, RAW_FILES[table]))
+        lines.append(f"{const} = [")
+        lines.extend(f"    {row!r}," for row in data)
+        lines.append("]")
+        lines.append("")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    print(f"✅ Wrote {os.path.relpath(path)}")
+
+def constants_fresh(repo_root):
+    try:
+        import small_tables
+    except ImportError:
+        return False
+    return getattr(small_tables, "SOURCE_SHA256", None) == _source_digest(repo_root)
+
+# ---------------------------
+# Cold-start benchmark
+# ---------------------------
+
+BENCH_SNIPPET = (
+    "import time; t=time.perf_counter(); import lookup; lookup.province(1); "
+    "print((time.perf_counter()-t)*1000, ','.join(lookup.loaded_tables()))"
+)
+
+def bench(runs):
+    """Import-to-first-province-lookup in fresh interpreters (ms), like a cold serverless start."""
+    import subprocess
+    scripts = os.path.dirname(os.path.abspath(__file__))
+    out = []
+    for _ in range(runs):
+        res = subprocess.run([sys.executable, "-c", BENCH_SNIPPET], cwd=scripts,
+                             check=True, capture_output=True, text=True)
+        ms, tables = res.stdout.split()
+        out.append(float(ms))
+    print(f"• loaded on first lookup: {tables}")
+    return out
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Lazy lookup tables: build constants / check / benchmark")
+    parser.add_argument("--root", default=None, help="Repo root (default: auto)")
+    parser.add_argument("--build-constants", action="store_true", help="Regenerate scripts/small_tables.py")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if small_tables.py is stale")
+    parser.add_argument("--bench", action="store_true", help="Measure cold import-to-first-lookup time")
+    parser.add_argument("--runs", type=int, default=10, help="Benchmark runs")
+    parser.add_argument("--target-ms", type=float, default=10.0, help="Fail --bench if the median is above this")
+    args = parser.parse_args()
+
+    repo_root = args.root or DEFAULT_ROOT
+
+    if args.build_constants:
+        build_constants(repo_root)
+    if args.check:
+        if not constants_fresh(repo_root):
+            print("⛔ scripts/small_tables.py is stale. Run: python3 scripts/lookup.py --build-constants")
+            sys.exit(1)
+        print("✅ scripts/small_tables.py is up to date")
+    if args.bench:
+        times = sorted(bench(args.runs))
+        median = times[len(times) // 2]
+        print(f"• cold start → first lookup: median {median:.2f} ms, min {times[0]:.2f} ms ({args.runs} runs)")
+        if median > args.target_ms:
+            print(f"⛔ above target {args.target_ms:.1f} ms")
+            sys.exit(1)
+        print(f"✅ within target {args.target_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # scripts/make.py
-# Orchestrate validate -> export formats -> export API
+# Orchestrate validate -> export formats -> export API -> release manifest
 
 import subprocess
 import sys
@@ -12,6 +12,8 @@ STEPS = [
     ["0_validate_data.py"],
     ["1_export_file_format.py", "--overwrite"],
     ["2_export_api.py", "--overwrite"],
+    ["lookup.py", "--build-constants"],
+    ["release.py", "build"],
 ]
 
 def run_step(cmd):
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# scripts/quality.py
+# Cross-table data-quality checks over data/raw (used by 0_validate_data.py --analyze).
+# Every check is one grouping pass over a table plus per-group work; no row-vs-row loops.
+
+import argparse
+import math
+import os
+import time
+from typing import Any, Dict, List
+
+import json_io
+
+# Optional: vectorised distance check (pure-Python fallback below)
+HAS_NUMPY = True
+try:
+    import numpy as np
+except Exception:
+    HAS_NUMPY = False
+
+RAW_DIR = "data/raw"
+TABLES = ["geographies", "provinces", "districts", "sub_districts"]
+
+# A sub-district this far (km) from its district's median point is flagged
+DEFAULT_MAX_KM = 60.0
+# Need this many located sub-districts in a district before judging outliers
+MIN_POINTS = 3
+
+EARTH_KM = 6371.0088
+# Punctuation ignored when comparing romanized names (whitespace is dropped via split)
+ROMAN_DROP = str.maketrans("", "", "-'’.")
+
+def group(rows: List[Dict[str, Any]], key) -> Dict[Any, List[Dict[str, Any]]]:
+    out: Dict[Any, List[Dict[str, Any]]] = {}
+    for r in rows:
+        out.setdefault(key(r), []).append(r)
+    return out
+
+def median(values: List[float]) -> float:
+    v = sorted(values)
+    n = len(v)
+    mid = n // 2
+    return v[mid] if n % 2 else (v[mid - 1] + v[mid]) / 2.0
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_KM * math.asin(min(1.0, math.sqrt(a)))
+
+def live(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rows not soft-deleted (same rule as rollups.py / geo.py)."""
+    return [r for r in rows if r.get("deleted_at") is None]
+
+def norm_thai(s: str) -> str:
+    return "".join(s.split())
+
+def norm_roman(s: str) -> str:
+    """'Bang Rak' / 'Bangrak' / 'Bang-Rak' -> 'bangrak'"""
+    return "".join(s.split()).translate(ROMAN_DROP).lower()
+
+# ---------------------------
+# Checks (each returns warning strings)
+# ---------------------------
+
+def _outlier_msg(s: Dict[str, Any], km: float, c_lat: float, c_lon: float) -> str:
+    return (f"[sub_districts] id={s.get('id')}: lat/long ({float(s['lat'])}, {float(s['long'])}) is {km:.0f} km "
+            f"from district_id={s.get('district_id')} median ({c_lat:.4f}, {c_lon:.4f})")
+
+def coordinate_outliers(subs: List[Dict[str, Any]], max_km: float) -> List[str]:
+    """Sub-districts farther than max_km from the median point of their district.
+
+    The median (not the mean) keeps one bad point from dragging the reference with it.
+    Findings are in input order. Uses numpy when installed (same results).
+    """
+    located = [s for s in subs if s.get("lat") is not None and s.get("long") is not None]
+    if HAS_NUMPY and located:
+        return _coordinate_outliers_np(located, max_km)
+    found = []
+    for did, members in group(located, lambda s: s.get("district_id")).items():
+        if len(members) < MIN_POINTS:
+            continue
+        lats = [float(s["lat"]) for s in members]
+        lons = [float(s["long"]) for s in members]
+        c_lat = median(lats)
+        c_lon = median(lons)
+        for s, lat, lon in zip(members, lats, lons):
+            km = haversine_km(c_lat, c_lon, lat, lon)
+            if km > max_km:
+                found.append((id(s), _outlier_msg(s, km, c_lat, c_lon)))
+    order = {id(s): i for i, s in enumerate(located)}
+    return [msg for _, msg in sorted(found, key=lambda f: order[f[0]])]
+
+def _coordinate_outliers_np(located: List[Dict[str, Any]], max_km: float) -> List[str]:
+    """Array version: per-district medians from one lexsort, distances for all rows at once."""
+    n = len(located)
+    lat = np.fromiter((float(s["lat"]) for s in located), dtype=float, count=n)
+    lon = np.fromiter((float(s["long"]) for s in located), dtype=float, count=n)
+    _, gid = np.unique(np.array([str(s.get("district_id")) for s in located]), return_inverse=True)
+    counts = np.bincount(gid)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    lo = starts + (counts - 1) // 2
+    hi = starts + counts // 2
+
+    def group_median(values):
+        v = values[np.lexsort((values, gid))]
+        return (v[lo] + v[hi]) / 2.0
+
+    c_lat = group_median(lat)[gid]
+    c_lon = group_median(lon)[gid]
+    p1 = np.radians(c_lat)
+    p2 = np.radians(lat)
+    a = np.sin((p2 - p1) / 2) ** 2 + np.cos(p1) * np.cos(p2) * np.sin(np.radians(lon - c_lon) / 2) ** 2
+    km = 2 * EARTH_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+    flagged = np.nonzero((counts[gid] >= MIN_POINTS) & (km > max_km))[0]
+    return [_outlier_msg(located[i], float(km[i]), float(c_lat[i]), float(c_lon[i])) for i in flagged]
+
+def zip_across_provinces(subs: List[Dict[str, Any]], dists: List[Dict[str, Any]]) -> List[str]:
+    prov_of_dist = {d.get("id"): d.get("province_id") for d in dists}
+    provs_of_zip: Dict[Any, Dict[Any, List[Any]]] = {}
+    for s in subs:
+        z = s.get("zip_code")
+        if z is None:
+            continue
+        pid = prov_of_dist.get(s.get("district_id"))
+        provs_of_zip.setdefault(z, {}).setdefault(pid, []).append(s.get("id"))
+    out = []
+    for z, by_prov in sorted(provs_of_zip.items(), key=lambda kv: str(kv[0])):
+        if len(by_prov) > 1:
+            detail = "; ".join(f"province_id={pid}: {len(ids)} sub-districts" for pid, ids in sorted(
+                by_prov.items(), key=lambda kv: str(kv[0])))
+            out.append(f"[sub_districts] zip_code {z} spans {len(by_prov)} provinces ({detail})")
+    return out
+
+def duplicate_names(label: str, rows: List[Dict[str, Any]], parent_col: str) -> List[str]:
+    """Same name_th (whitespace-insensitive) twice under one parent: likely one entity entered twice."""
+    out = []
+    groups = group(
+        [r for r in rows if isinstance(r.get("name_th"), str)],
+        lambda r: (r.get(parent_col), norm_thai(r["name_th"])),
+    )
+    for (parent, _), members in groups.items():
+        if len(members) > 1:
+            ids = [m.get("id") for m in members]
+            out.append(f"[{label}] duplicate name_th '{members[0]['name_th']}' under {parent_col}={parent}: ids {ids}")
+    return out
+
+def name_en_collisions(label: str, rows: List[Dict[str, Any]], parent_col: str) -> List[str]:
+    """Different Thai names romanized to the same name_en under one parent (e.g. two 'Bang Sai').
+
+    Not duplicates: the entities are distinct, but name_en alone cannot tell them apart.
+    Rows that also share name_th are left to duplicate_names.
+    """
+    out = []
+    groups = group(
+        [r for r in rows if isinstance(r.get("name_en"), str) and isinstance(r.get("name_th"), str)],
+        lambda r: (r.get(parent_col), norm_roman(r["name_en"])),
+    )
+    for (parent, _), members in groups.items():
+        names_th = sorted({norm_thai(m["name_th"]) for m in members})
+        if len(names_th) > 1:
+            ids = [m.get("id") for m in members]
+            out.append(f"[{label}] name_en '{members[0]['name_en']}' shared by different name_th {names_th} "
+                       f"under {parent_col}={parent}: ids {ids}")
+    return out
+
+def romanization_inconsistencies(label: str, rows: List[Dict[str, Any]]) -> List[str]:
+    """One name_th written in English with differing spacing/case/hyphens (e.g. 'Bang Rak' vs 'Bangrak')."""
+    out = []
+    spellings = group(
+        [r for r in rows if r.get("name_th") and r.get("name_en")],
+        lambda r: (r["name_th"], norm_roman(r["name_en"])),
+    )
+    for (name_th, _), same in spellings.items():
+        variants = sorted({r["name_en"] for r in same})
+        if len(variants) > 1:
+            ids = [r.get("id") for r in same]
+            out.append(f"[{label}] name_th '{name_th}' romanized inconsistently: {variants} (ids {ids})")
+    return out
+
+def analyze(raws: Dict[str, List[Dict[str, Any]]], max_km: float = DEFAULT_MAX_KM) -> Dict[str, List[str]]:
+    """Run all checks on rows that are not soft-deleted; result is check name -> warnings."""
+    dists = live(raws.get("districts", []))
+    subs = live(raws.get("sub_districts", []))
+    provs = live(raws.get("provinces", []))
+    return {
+        "coordinate_outliers": coordinate_outliers(subs, max_km),
+        "zip_across_provinces": zip_across_provinces(subs, dists),
+        "duplicate_names": (duplicate_names("provinces", provs, "geography_id")
+                            + duplicate_names("districts", dists, "province_id")
+                            + duplicate_names("sub_districts", subs, "district_id")),
+        "name_en_collisions": (name_en_collisions("provinces", provs, "geography_id")
+                               + name_en_collisions("districts", dists, "province_id")
+                               + name_en_collisions("sub_districts", subs, "district_id")),
+        "romanization": (romanization_inconsistencies("districts", dists)
+                         + romanization_inconsistencies("sub_districts", subs)),
+    }
+
+# ---------------------------
+# Synthetic scale-up (benchmarking)
+# ---------------------------
+
+def scale_up(raws: Dict[str, List[Dict[str, Any]]], factor: int) -> Dict[str, List[Dict[str, Any]]]:
+    """factor disjoint copies of provinces/districts/sub_districts.
+
+    Each copy shifts ids, FKs and zip codes and tags names with "#k", so copies never
+    collide with each other and findings at scale N are N times the real ones.
+    """
+    if factor <= 1:
+        return raws
+    out = dict(raws)
+    provs, dists, subs = [], [], []
+
+    def tag(row: Dict[str, Any], k: int) -> Dict[str, Any]:
+        for col in ("name_th", "name_en"):
+            if k and isinstance(row.get(col), str):
+                row[col] = f"{row[col]}#{k}"
+        return row
+
+    for k in range(factor):
+        p_off = k * 1000
+        d_off = k * 100000
+        s_off = k * 10000000
+        z_off = k * 100000
+        provs.extend(tag(dict(p, id=p["id"] + p_off), k) for p in raws["provinces"])
+        dists.extend(tag(dict(d, id=d["id"] + d_off, province_id=d["province_id"] + p_off), k)
+                     for d in raws["districts"])
+        subs.extend(tag(dict(s, id=s["id"] + s_off, district_id=s["district_id"] + d_off,
+                             zip_code=s["zip_code"] + z_off if isinstance(s.get("zip_code"), int) else s.get("zip_code")), k)
+                    for s in raws["sub_districts"])
+    out["provinces"] = provs
+    out["districts"] = dists
+    out["sub_districts"] = subs
+    return out
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-table data-quality report for data/raw")
+    parser.add_argument("--root", default=None, help="Repo root (default: auto)")
+    parser.add_argument("--max-km", type=float, default=DEFAULT_MAX_KM, help="Outlier distance from district median")
+    parser.add_argument("--scale", type=int, default=1, help="Run on N synthetic copies (benchmark)")
+    parser.add_argument("--limit", type=int, default=20, help="Show at most N findings per check (0 = all)")
+    parser.add_argument("--no-numpy", action="store_true", help="Use the pure-Python outlier check")
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = args.root or os.path.abspath(os.path.join(script_dir, ".."))
+    raws = {t: json_io.load_rows(os.path.join(repo_root, RAW_DIR, f"{t}.json")) for t in TABLES}
+    raws = scale_up(raws, args.scale)
+    if args.no_numpy:
+        global HAS_NUMPY
+        HAS_NUMPY = False
+
+    t0 = time.perf_counter()
+    report = analyze(raws, args.max_km)
+    elapsed = time.perf_counter() - t0
+
+    for check, found in report.items():
+        print(f"\n• {check}: {len(found)}")
+        shown = found if args.limit <= 0 else found[:args.limit]
+        for msg in shown:
+            print(f"  - {msg}")
+        if len(shown) < len(found):
+            print(f"  ... {len(found) - len(shown)} more")
+    print(f"\n⏱  {len(raws['sub_districts']):,} sub-districts analyzed in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# scripts/release.py
+# Release manifest (release.json): SHA-256 + size of every published artifact,
+# row counts and dataset version. "verify" checks a local mirror against it in parallel.
+
+import argparse
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+from urllib.request import urlopen
+
+import json_io
+
+RAW_DIR = "data/raw"
+TABLES = ["geographies", "provinces", "districts", "sub_districts"]
+MANIFEST_FILE = "release.json"
+MANIFEST_FORMAT = 1
+
+# Published trees, relative to repo root
+ARTIFACT_DIRS = ["api/latest", "api/v1", "formats"]
+
+# Built by the pipeline but not committed, so never mirrored from the repo
+UNPUBLISHED = [
+    "api/latest/sub_district_with_district_and_province.json",
+]
+
+CHUNK = 1 << 20
+
+def sha256_file(path: str) -> Tuple[str, int]:
+    h = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(CHUNK)
+            if not block:
+                break
+            h.update(block)
+            size += len(block)
+    return h.hexdigest(), size
+
+def list_artifacts(repo_root: str) -> List[str]:
+    """Repo-relative POSIX paths under ARTIFACT_DIRS minus UNPUBLISHED, sorted (stable across OS/filesystems)."""
+    out = []
+    for d in ARTIFACT_DIRS:
+        base = os.path.join(repo_root, d)
+        for dirpath, dirnames, filenames in os.walk(base):
+            for name in filenames:
+                if name.startswith(".") or name.endswith(".tmp"):
+                    continue
+                rel = os.path.relpath(os.path.join(dirpath, name), repo_root).replace(os.sep, "/")
+                if not any(rel == u or (u.endswith("/") and rel.startswith(u)) for u in UNPUBLISHED):
+                    out.append(rel)
+    return sorted(out)
+
+def hash_many(repo_root: str, paths: List[str], workers: int) -> Dict[str, Tuple[str, int]]:
+    # hashlib releases the GIL on large buffers, so threads hash in parallel
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(lambda p: sha256_file(os.path.join(repo_root, p)), paths)
+        return dict(zip(paths, results))
+
+def dataset_info(repo_root: str) -> Dict[str, Any]:
+    """Row counts, newest updated_at and a digest of data/raw (the dataset version)."""
+    h = hashlib.sha256()
+    rows: Dict[str, int] = {}
+    newest = ""
+    for table in TABLES:
+        path = os.path.join(repo_root, RAW_DIR, f"{table}.json")
+        with open(path, "rb") as f:
+            data = f.read()
+        h.update(table.encode("utf-8") + b"\0" + data)
+        table_rows = json_io.loads(data)
+        rows[table] = len(table_rows)
+        for r in table_rows:
+            u = r.get("updated_at")
+            if isinstance(u, str) and u > newest:
+                newest = u
+    digest = h.hexdigest()
+    return {
+        # date of the newest edit + raw digest: readable and unique per content
+        "version": f"{newest[:10] or 'unknown'}+{digest[:12]}",
+        "raw_sha256": digest,
+        "updated_at": newest or None,
+        "rows": rows,
+    }
+
+def build_manifest(repo_root: str, workers: int) -> Dict[str, Any]:
+    """Deterministic: sorted paths, no build time, so identical outputs give identical bytes."""
+    paths = list_artifacts(repo_root)
+    hashes = hash_many(repo_root, paths, workers)
+    info = dataset_info(repo_root)
+    return {
+        "format": MANIFEST_FORMAT,
+        "dataset": info,
+        "artifacts": {p: {"sha256": hashes[p][0], "bytes": hashes[p][1]} for p in paths},
+    }
+
+def load_manifest(src: str) -> Dict[str, Any]:
+    if src.startswith(("http://", "https://")):
+        with urlopen(src) as resp:
+            return json_io.loads(resp.read())
+    return json_io.load_json(src)
+
+def verify(repo_root: str, manifest: Dict[str, Any], workers: int, sizes_only: bool) -> Dict[str, List[str]]:
+    """Compare local files to the manifest. Size is checked first; hashing only when sizes agree."""
+    artifacts: Dict[str, Dict[str, Any]] = manifest.get("artifacts", {})
+    missing, changed, to_hash = [], [], []
+    for rel, meta in artifacts.items():
+        path = os.path.join(repo_root, rel)
+        if not os.path.isfile(path):
+            missing.append(rel)
+        elif os.path.getsize(path) != meta.get("bytes"):
+            changed.append(rel)
+        else:
+            to_hash.append(rel)
+    if not sizes_only:
+        for rel, (digest, _) in hash_many(repo_root, to_hash, workers).items():
+            if digest != artifacts[rel].get("sha256"):
+                changed.append(rel)
+    local = set(list_artifacts(repo_root))
+    extra = sorted(local - set(artifacts))
+    return {"missing": sorted(missing), "changed": sorted(changed), "extra": extra}
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or verify the release manifest (release.json)")
+    parser.add_argument("--root", default=None, help="Repo root or mirror directory (default: auto)")
+    parser.add_argument("--workers", type=int, default=min(32, (os.cpu_count() or 1) * 4), help="Hashing threads")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("build", help=f"Write {MANIFEST_FILE} for the current outputs")
+    p_verify = sub.add_parser("verify", help="Check local files against a manifest")
+    p_verify.add_argument("--manifest", default=None,
+                          help=f"Manifest path or URL (default: <root>/{MANIFEST_FILE})")
+    p_verify.add_argument("--sizes-only", action="store_true", help="Skip hashing; compare byte sizes only")
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = args.root or os.path.abspath(os.path.join(script_dir, ".."))
+
+    if args.cmd == "build":
+        manifest = build_manifest(repo_root, args.workers)
+        path = os.path.join(repo_root, MANIFEST_FILE)
+        json_io.save_json(path, manifest, 2)
+        ds = manifest["dataset"]
+        print(f"✅ Wrote {os.path.relpath(path)}: {len(manifest['artifacts'])} artifacts, version {ds['version']}")
+        return
+
+    manifest = load_manifest(args.manifest or os.path.join(repo_root, MANIFEST_FILE))
+    result = verify(repo_root, manifest, args.workers, args.sizes_only)
+    print(f"• Dataset version: {manifest.get('dataset', {}).get('version')}")
+    for label in ("missing", "changed", "extra"):
+        for rel in result[label]:
+            print(f"  {label:8} {rel}")
+    bad = len(result["missing"]) + len(result["changed"])
+    if bad:
+        print(f"\n⛔ {bad} artifact(s) differ from the manifest ({len(manifest.get('artifacts', {}))} listed).")
+        sys.exit(1)
+    print(f"\n✅ All {len(manifest.get('artifacts', {}))} artifacts match.")
+
+if __name__ == "__main__":
+    main()
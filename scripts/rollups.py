@@ -0,0 +1,159 @@
+# scripts/rollups.py
+# Hierarchy aggregates (counts, zip codes, centroid/bbox) computed once per build.
+# Used by 2_export_api.py for api/latest/stats and importable for in-process lookups.
+
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import json_io
+
+RAW_DIR = "data/raw"
+DEFAULT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+RAW_FILES = {
+    "provinces": os.path.join(RAW_DIR, "provinces.json"),
+    "districts": os.path.join(RAW_DIR, "districts.json"),
+    "sub_districts": os.path.join(RAW_DIR, "sub_districts.json"),
+}
+
+COORD_DIGITS = 6
+
+def group_by(rows: List[Dict[str, Any]], key: str) -> Dict[int, List[Dict[str, Any]]]:
+    """Group rows by an integer FK column, keeping input order within each group."""
+    out: Dict[int, List[Dict[str, Any]]] = {}
+    for r in rows:
+        fk = r.get(key)
+        if isinstance(fk, int):
+            out.setdefault(fk, []).append(r)
+    return out
+
+def _live(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [r for r in rows if r.get("deleted_at") is None]
+
+class _Extent:
+    """Running sum/min/max of lat/long points."""
+
+    def __init__(self):
+        self.n = 0
+        self.sum_lat = 0.0
+        self.sum_long = 0.0
+        self.min_lat = self.min_long = float("inf")
+        self.max_lat = self.max_long = float("-inf")
+
+    def add(self, lat: Any, lon: Any):
+        if lat is None or lon is None:
+            return
+        lat = float(lat)
+        lon = float(lon)
+        self.n += 1
+        self.sum_lat += lat
+        self.sum_long += lon
+        if lat < self.min_lat:
+            self.min_lat = lat
+        if lat > self.max_lat:
+            self.max_lat = lat
+        if lon < self.min_long:
+            self.min_long = lon
+        if lon > self.max_long:
+            self.max_long = lon
+
+    def merge(self, other: "_Extent"):
+        if not other.n:
+            return
+        self.n += other.n
+        self.sum_lat += other.sum_lat
+        self.sum_long += other.sum_long
+        self.min_lat = min(self.min_lat, other.min_lat)
+        self.max_lat = max(self.max_lat, other.max_lat)
+        self.min_long = min(self.min_long, other.min_long)
+        self.max_long = max(self.max_long, other.max_long)
+
+    def centroid(self) -> Optional[List[float]]:
+        if not self.n:
+            return None
+        return [round(self.sum_lat / self.n, COORD_DIGITS), round(self.sum_long / self.n, COORD_DIGITS)]
+
+    def bbox(self) -> Optional[List[float]]:
+        """[min_lat, min_long, max_lat, max_long]"""
+        if not self.n:
+            return None
+        return [self.min_lat, self.min_long, self.max_lat, self.max_long]
+
+def build_rollups(
+        provinces: List[Dict[str, Any]],
+        dist_by_pid: Dict[int, List[Dict[str, Any]]],
+        sub_by_did: Dict[int, List[Dict[str, Any]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Aggregate per district and per province in one pass over the groupings.
+
+    Takes the same dist_by_pid/sub_by_did groupings as build_province_with_children.
+    Soft-deleted rows are not counted. Centroid is the mean of sub-district points
+    that have lat/long; points_with_coords tells how many that was.
+    """
+    province_stats: List[Dict[str, Any]] = []
+    district_stats: List[Dict[str, Any]] = []
+    for p in _live(provinces):
+        pid = p.get("id")
+        p_extent = _Extent()
+        p_zips = set()
+        p_subs = 0
+        dists = _live(dist_by_pid.get(pid, []) or [])
+        for d in dists:
+            subs = _live(sub_by_did.get(d.get("id"), []) or [])
+            d_extent = _Extent()
+            d_zips = set()
+            for s in subs:
+                d_extent.add(s.get("lat"), s.get("long"))
+                if s.get("zip_code") is not None:
+                    d_zips.add(s["zip_code"])
+            district_stats.append({
+                "id": d.get("id"),
+                "province_id": pid,
+                "sub_district_count": len(subs),
+                "zip_codes": sorted(d_zips),
+                "points_with_coords": d_extent.n,
+                "centroid": d_extent.centroid(),
+                "bbox": d_extent.bbox(),
+            })
+            p_extent.merge(d_extent)
+            p_zips |= d_zips
+            p_subs += len(subs)
+        province_stats.append({
+            "id": pid,
+            "district_count": len(dists),
+            "sub_district_count": p_subs,
+            "zip_code_count": len(p_zips),
+            "zip_codes": sorted(p_zips),
+            "points_with_coords": p_extent.n,
+            "centroid": p_extent.centroid(),
+            "bbox": p_extent.bbox(),
+        })
+    return {"province": province_stats, "district": district_stats}
+
+# ---------------------------
+# Cached in-process accessors
+# ---------------------------
+
+@lru_cache(maxsize=None)
+def load_rollups(repo_root: str = DEFAULT_ROOT) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """Rollups keyed by id, computed once per process from data/raw (shared; do not mutate)."""
+    provinces = json_io.load_rows(os.path.join(repo_root, RAW_FILES["provinces"]))
+    districts = json_io.load_rows(os.path.join(repo_root, RAW_FILES["districts"]))
+    sub_districts = json_io.load_rows(os.path.join(repo_root, RAW_FILES["sub_districts"]))
+    stats = build_rollups(provinces, group_by(districts, "province_id"), group_by(sub_districts, "district_id"))
+    return {level: {r["id"]: r for r in rows} for level, rows in stats.items()}
+
+def _copy(row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # rows only hold scalars and flat lists; copying both keeps the cache untouched
+    if row is None:
+        return None
+    return {k: list(v) if isinstance(v, list) else v for k, v in row.items()}
+
+def province_stats(province_id: int, repo_root: str = DEFAULT_ROOT) -> Optional[Dict[str, Any]]:
+    """Stats for one province (a copy; safe to mutate)."""
+    return _copy(load_rollups(repo_root)["province"].get(province_id))
+
+def district_stats(district_id: int, repo_root: str = DEFAULT_ROOT) -> Optional[Dict[str, Any]]:
+    """Stats for one district (a copy; safe to mutate)."""
+    return _copy(load_rollups(repo_root)["district"].get(district_id))